@@ -29,6 +29,7 @@ bl_info = {
 from .properties import register_properties, unregister_properties
 from .operators import register_operators, unregister_operators
 from .panels import register_panels, unregister_panels
+from .extractor import register_handlers, unregister_handlers
 
 # glTF export/import hooks — Blender's glTF add-on discovers these
 # by name from registered add-on modules. They MUST be importable
@@ -41,10 +42,12 @@ def register():
     register_properties()
     register_operators()
     register_panels()
+    register_handlers()
 
 
 def unregister():
     """Unregister all add-on classes, properties, and panels."""
+    unregister_handlers()
     unregister_panels()
     unregister_operators()
     unregister_properties()
@@ -3,6 +3,8 @@ Constants, enums, and field definitions for the METRO metadata schema.
 Mirrors the METRO 3D Asset Registry API v1.0.
 """
 
+import sys
+
 # Schema version — used in exported JSON and scene custom properties
 SCHEMA_VERSION = "1.0.0"
 
@@ -80,6 +82,7 @@ FORMAT_TO_MIME = {
     "stl": "model/stl",
     "ply": "application/x-ply",
 }
+FORMAT_TO_MIME = {k: sys.intern(v) for k, v in FORMAT_TO_MIME.items()}
 
 # ---------------------------------------------------------------------------
 # Field name mappings: internal (snake_case) -> API (camelCase)
@@ -130,6 +133,10 @@ FIELD_MAP_TO_API = {
     "access_scope": "accessScope",
 }
 
+# Dotted API paths aren't identifier-like, so the compiler doesn't intern
+# them; do it here so lookups keyed by these strings compare by identity.
+FIELD_MAP_TO_API = {k: sys.intern(v) for k, v in FIELD_MAP_TO_API.items()}
+
 # Reverse mapping: API camelCase -> internal snake_case
 FIELD_MAP_FROM_API = {v: k for k, v in FIELD_MAP_TO_API.items()}
 
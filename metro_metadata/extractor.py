@@ -7,8 +7,6 @@ and vertex count directly from Blender's Python API.
 
 import os
 import bpy
-import bmesh
-from mathutils import Vector
 
 
 def extract_from_scene(scene):
@@ -40,14 +38,15 @@ def extract_from_scene(scene):
     tech.supports_pbr = totals["supports_pbr"]
 
     # Auto-detect format from blend file name
-    if bpy.data.filepath:
+    blend_path = bpy.data.filepath
+    if blend_path:
         core.asset_format = "blend"
 
     # Auto-fill name from file or scene if empty
     if not core.asset_name:
-        if bpy.data.filepath:
+        if blend_path:
             core.asset_name = os.path.splitext(
-                os.path.basename(bpy.data.filepath)
+                os.path.basename(blend_path)
             )[0]
         else:
             core.asset_name = scene.name
@@ -55,12 +54,14 @@ def extract_from_scene(scene):
     return totals
 
 
-def extract_from_object(obj):
+def extract_from_object(obj, mat_cache=None):
     """
     Extract metadata from a single mesh object.
 
     Args:
         obj: bpy.types.Object — must be a MESH object.
+        mat_cache: Optional dict shared across calls so materials used
+            by several objects are only classified once.
 
     Returns:
         dict with extracted values, or None if not a mesh.
@@ -68,22 +69,91 @@ def extract_from_object(obj):
     if obj is None or obj.type != "MESH":
         return None
 
+    if mat_cache is None:
+        mat_cache = {}
+    stats = _extract_obj_cached(obj, bpy.context.evaluated_depsgraph_get(), mat_cache)
+
+    # Each obj.dimensions access builds a new Vector; read it once
+    bx, by, bz = obj.dimensions
+
     return {
-        "tri_count": _count_triangles(obj),
-        "vertex_count": len(obj.data.vertices),
-        "bbox_x": obj.dimensions.x,
-        "bbox_y": obj.dimensions.y,
-        "bbox_z": obj.dimensions.z,
+        "tri_count": stats["tri_count"],
+        "vertex_count": stats["vertex_count"],
+        "bbox_x": bx,
+        "bbox_y": by,
+        "bbox_z": bz,
         "material_count": len(obj.data.materials),
-        "has_textures": _has_textures(obj),
-        "supports_pbr": _supports_pbr(obj),
+        "has_textures": stats["has_textures"],
+        "supports_pbr": stats["supports_pbr"],
     }
 
 
+def visible_mesh_objects(scene):
+    """
+    Return the scene's visible mesh objects.
+
+    visible_get() walks view-layer and collection visibility, so callers
+    should compute this once per pass and reuse the list.
+    """
+    return [
+        obj for obj in scene.objects
+        if obj.type == "MESH" and obj.visible_get()
+    ]
+
+
+def register_handlers():
+    """Install the handlers that invalidate cached extractions."""
+    if _on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    if _on_frame_change not in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.append(_on_frame_change)
+
+
+def unregister_handlers():
+    """Remove the invalidation handlers and drop cached extractions."""
+    if _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if _on_frame_change in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(_on_frame_change)
+    _OBJ_CACHE.clear()
+    _SCENE_CACHE.clear()
+
+
 # -------------------------------------------------------------------
 # Internal helpers
 # -------------------------------------------------------------------
 
+# Per-object extraction results: obj.as_pointer() -> (cache_key, stats).
+# Scene totals: scene.as_pointer() -> (cache_key, totals).
+# Entries are invalidated by bumping _update_count on depsgraph updates
+# and frame changes (animation does not fire depsgraph_update_post).
+_OBJ_CACHE = {}
+_SCENE_CACHE = {}
+_update_count = 0
+
+# Data-block types whose changes can affect extracted values. Edits to
+# the METRO properties themselves only update the Scene and are ignored.
+_GEOMETRY_ID_TYPES = ("OBJECT", "MESH", "MATERIAL", "NODETREE", "COLLECTION", "IMAGE")
+
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph=None):
+    """Bump the update counter so cached extraction results are recomputed."""
+    global _update_count
+    if depsgraph is not None and not any(
+        depsgraph.id_type_updated(id_type) for id_type in _GEOMETRY_ID_TYPES
+    ):
+        return
+    _update_count += 1
+
+
+@bpy.app.handlers.persistent
+def _on_frame_change(scene, depsgraph=None):
+    """Animated transforms and modifiers change geometry on every frame."""
+    global _update_count
+    _update_count += 1
+
+
 def _aggregate_scene_meshes(scene):
     """Aggregate metadata across all mesh objects in the scene."""
     total_tris = 0
@@ -92,14 +162,15 @@ def _aggregate_scene_meshes(scene):
     any_textures = False
     any_pbr = False
 
-    # Scene-level bounding box: min/max across all objects
-    min_co = [float("inf")] * 3
-    max_co = [float("-inf")] * 3
+    # Fetched before the cache lookup: evaluating flushes pending edits
+    # through _on_depsgraph_update, so script changes bump _update_count
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    mesh_objects = visible_mesh_objects(scene)
 
-    mesh_objects = [
-        obj for obj in scene.objects
-        if obj.type == "MESH" and obj.visible_get()
-    ]
+    cache_key = (_update_count, tuple(obj.as_pointer() for obj in mesh_objects))
+    cached = _SCENE_CACHE.get(scene.as_pointer())
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
 
     if not mesh_objects:
         return {
@@ -113,82 +184,169 @@ def _aggregate_scene_meshes(scene):
             "supports_pbr": False,
         }
 
+    mat_cache = {}
+    obj_mins = []
+    obj_maxs = []
+
     for obj in mesh_objects:
-        total_tris += _count_triangles(obj)
-        total_verts += len(obj.data.vertices)
+        stats = _extract_obj_cached(obj, depsgraph, mat_cache)
 
-        # Materials
-        for mat_slot in obj.material_slots:
-            if mat_slot.material:
-                total_materials.add(mat_slot.material.name)
+        total_tris += stats["tri_count"]
+        total_verts += stats["vertex_count"]
+        total_materials.update(stats["materials"])
+        any_textures = any_textures or stats["has_textures"]
+        any_pbr = any_pbr or stats["supports_pbr"]
 
-        any_textures = any_textures or _has_textures(obj)
-        any_pbr = any_pbr or _supports_pbr(obj)
+        obj_mins.append(stats["world_min"])
+        obj_maxs.append(stats["world_max"])
 
-        # World-space bounding box
-        for corner in obj.bound_box:
-            world_co = obj.matrix_world @ Vector(corner)
-            for i in range(3):
-                min_co[i] = min(min_co[i], world_co[i])
-                max_co[i] = max(max_co[i], world_co[i])
+    # Scene-level world-space bounding box: min/max across all objects.
+    # numpy is imported here, not at module level, so enabling the add-on
+    # does not load it before any extraction runs.
+    import numpy as np
+    min_co = np.min(obj_mins, axis=0)
+    max_co = np.max(obj_maxs, axis=0)
 
-    return {
+    totals = {
         "tri_count": total_tris,
         "vertex_count": total_verts,
-        "bbox_x": round(max_co[0] - min_co[0], 4),
-        "bbox_y": round(max_co[1] - min_co[1], 4),
-        "bbox_z": round(max_co[2] - min_co[2], 4),
+        "bbox_x": round(float(max_co[0] - min_co[0]), 4),
+        "bbox_y": round(float(max_co[1] - min_co[1]), 4),
+        "bbox_z": round(float(max_co[2] - min_co[2]), 4),
         "material_count": len(total_materials),
         "has_textures": any_textures,
         "supports_pbr": any_pbr,
     }
+    _SCENE_CACHE[scene.as_pointer()] = (cache_key, totals)
+    return totals
+
+
+def _extract_obj_cached(obj, depsgraph, mat_cache):
+    """
+    Evaluate, triangulate, and measure a mesh object exactly once.
+
+    Results are memoized per object and reused by both the scene
+    aggregation and the glTF node hook until the depsgraph changes.
+
+    Returns:
+        dict with tri_count, vertex_count, world_min, world_max,
+        materials (set of material pointers), has_textures, supports_pbr.
+    """
+    ptr = obj.as_pointer()
+    key = (obj.name, obj.data.name, _update_count)
+    cached = _OBJ_CACHE.get(ptr)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # World-space bounding box: transform all 8 corners in one matmul
+    import numpy as np
+    corners = np.array(obj.bound_box, dtype=np.float64)
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    world = corners @ matrix[:3, :3].T + matrix[:3, 3]
+
+    materials = {
+        mat_slot.material.as_pointer()
+        for mat_slot in obj.material_slots
+        if mat_slot.material
+    }
+
+    has_textures, supports_pbr = _material_flags(obj, mat_cache)
+
+    stats = {
+        "tri_count": _count_triangles(obj, depsgraph),
+        "vertex_count": len(obj.data.vertices),
+        "world_min": world.min(axis=0),
+        "world_max": world.max(axis=0),
+        "materials": materials,
+        "has_textures": has_textures,
+        "supports_pbr": supports_pbr,
+    }
+    _OBJ_CACHE[ptr] = (key, stats)
+    return stats
 
 
-def _count_triangles(obj):
+def _count_triangles(obj, depsgraph):
     """
-    Count triangles by temporarily triangulating the mesh via bmesh.
+    Count triangles of the evaluated (modifiers applied) mesh using
+    Blender's native loop-triangle tessellation.
     Non-destructive — does not modify the actual mesh.
+
+    Objects without modifiers are read from obj.data directly, skipping
+    the temporary evaluated mesh copy. Objects in Edit Mode always go
+    through the depsgraph, as obj.data lags behind the edit-mesh.
     """
     if obj.type != "MESH":
         return 0
 
-    # Use the evaluated (modifiers applied) mesh if possible
-    depsgraph = bpy.context.evaluated_depsgraph_get()
-    eval_obj = obj.evaluated_get(depsgraph)
-    mesh = eval_obj.to_mesh()
+    eval_obj = None
+    if not obj.modifiers and obj.mode != "EDIT":
+        mesh = obj.data
+    else:
+        eval_obj = obj.evaluated_get(depsgraph)
+        mesh = eval_obj.to_mesh()
 
     if mesh is None:
         return 0
 
-    bm = bmesh.new()
     try:
-        bm.from_mesh(mesh)
-        bmesh.ops.triangulate(bm, faces=bm.faces[:])
-        tri_count = len(bm.faces)
+        # Every polygon has at least 3 corners, so the mesh is already
+        # fully triangulated exactly when loops == 3 * polygons.
+        if len(mesh.loops) == 3 * len(mesh.polygons):
+            tri_count = len(mesh.polygons)
+        else:
+            mesh.calc_loop_triangles()
+            tri_count = len(mesh.loop_triangles)
     finally:
-        bm.free()
-        eval_obj.to_mesh_clear()
+        if eval_obj is not None:
+            eval_obj.to_mesh_clear()
 
     return tri_count
 
 
-def _has_textures(obj):
-    """Check if any material on the object uses image textures."""
+def _material_flags(obj, mat_cache):
+    """
+    Return (has_textures, supports_pbr) across the object's materials.
+
+    Stops as soon as both flags are set; they can only turn True.
+    """
+    any_textures = False
+    any_pbr = False
     for mat_slot in obj.material_slots:
         mat = mat_slot.material
-        if mat and mat.use_nodes and mat.node_tree:
-            for node in mat.node_tree.nodes:
-                if node.type == "TEX_IMAGE" and node.image:
-                    return True
-    return False
+        if mat is None:
+            continue
+        has_tex, has_pbr = _classify_material(mat, mat_cache)
+        any_textures = any_textures or has_tex
+        any_pbr = any_pbr or has_pbr
+        if any_textures and any_pbr:
+            break
+    return any_textures, any_pbr
 
 
-def _supports_pbr(obj):
-    """Check if any material on the object uses Principled BSDF."""
-    for mat_slot in obj.material_slots:
-        mat = mat_slot.material
-        if mat and mat.use_nodes and mat.node_tree:
-            for node in mat.node_tree.nodes:
-                if node.type == "BSDF_PRINCIPLED":
-                    return True
-    return False
+def _classify_material(mat, cache):
+    """
+    Check whether a material uses image textures and/or Principled BSDF.
+
+    Walks the node tree once for both flags and memoizes the result in
+    ``cache`` keyed by ``mat.as_pointer()``, so materials shared between
+    objects are only inspected once per extraction.
+    """
+    ptr = mat.as_pointer()
+    flags = cache.get(ptr)
+    if flags is not None:
+        return flags
+
+    has_tex = False
+    has_pbr = False
+    if mat.use_nodes and mat.node_tree:
+        for node in mat.node_tree.nodes:
+            if node.type == "TEX_IMAGE" and node.image:
+                has_tex = True
+            elif node.type == "BSDF_PRINCIPLED":
+                has_pbr = True
+            if has_tex and has_pbr:
+                break
+
+    flags = (has_tex, has_pbr)
+    cache[ptr] = flags
+    return flags
@@ -10,11 +10,10 @@ When the file is uploaded to the METRO API, the API reads the extras
 and auto-populates all metadata fields.
 """
 
-import json
 import bpy
 
-from .injector import collect_metadata
-from .reader import _apply_metro_dict
+# Column order of the rows in the scene-level "metro_object_stats" table
+OBJECT_STATS_SCHEMA = ("node", "triCount", "vertexCount", "bboxX", "bboxY", "bboxZ")
 
 
 # ===================================================================
@@ -30,11 +29,27 @@ class glTF2ExportUserExtension:
     into the exported .glTF/.glb file.
     """
 
+    # Resolved on first instantiation, then shared by all exports
+    _ExtensionCls = None
+
     def __init__(self):
         # Required by Blender's glTF exporter API
-        from io_scene_gltf2.io.com.gltf2_io_extensions import Extension
-        self.Extension = Extension
-        self.properties = bpy.context.scene.metro_core
+        cls = type(self)
+        if cls._ExtensionCls is None:
+            from io_scene_gltf2.io.com.gltf2_io_extensions import Extension
+            cls._ExtensionCls = Extension
+        self.Extension = cls._ExtensionCls
+
+        # Count visible mesh objects once per export instead of once
+        # per exported node — gather_node_hook fires for every node.
+        from .extractor import visible_mesh_objects
+        self._mesh_count = len(visible_mesh_objects(bpy.context.scene))
+        # Per-object extraction results, keyed by object name
+        self._extracted_per_obj = {}
+        # Material texture/PBR flags, shared by all nodes in this export
+        self._mat_cache = {}
+        # Per-node stats rows, attached once at scene level
+        self._object_stats_rows = []
 
     def gather_scene_hook(self, export_settings, gltf_scene, blender_scene):
         """Called for each scene during glTF export."""
@@ -42,44 +57,51 @@ class glTF2ExportUserExtension:
             gltf_scene.extras = {}
 
         # Collect all METRO metadata from the scene's property groups
+        from .injector import collect_metadata
         metadata = collect_metadata(blender_scene)
 
         if metadata and metadata.get("name"):
             gltf_scene.extras["metro_metadata"] = metadata
 
+        # Per-object stats gathered by gather_node_hook, stored as a
+        # table so the key names are written once instead of per node.
+        # Readers rebuild each row with dict(zip(schema, row)).
+        if self._object_stats_rows:
+            gltf_scene.extras["metro_object_stats"] = {
+                "schema": list(OBJECT_STATS_SCHEMA),
+                "rows": self._object_stats_rows,
+            }
+            self._object_stats_rows = []
+
     def gather_node_hook(self, export_settings, gltf_node, blender_object):
         """
         Called for each node (object) during glTF export.
-        We store per-object technical data if the object is a mesh.
+        We collect per-object technical data if the object is a mesh;
+        it is written to the scene extras by gather_scene_hook.
         """
         if blender_object is None or blender_object.type != "MESH":
             return
 
         # Only add per-object data if there are multiple mesh objects,
         # otherwise the scene-level data is sufficient.
-        mesh_count = sum(
-            1 for obj in bpy.context.scene.objects
-            if obj.type == "MESH" and obj.visible_get()
-        )
-        if mesh_count <= 1:
+        if self._mesh_count <= 1:
             return
 
         # Add basic per-object stats
-        if gltf_node.extras is None:
-            gltf_node.extras = {}
-
-        from .extractor import extract_from_object
-        obj_data = extract_from_object(blender_object)
+        obj_data = self._extracted_per_obj.get(blender_object.name)
+        if obj_data is None:
+            from .extractor import extract_from_object
+            obj_data = extract_from_object(blender_object, self._mat_cache)
+            self._extracted_per_obj[blender_object.name] = obj_data
         if obj_data:
-            gltf_node.extras["metro_object_stats"] = {
-                "triCount": obj_data["tri_count"],
-                "vertexCount": obj_data["vertex_count"],
-                "boundingBox": {
-                    "x": round(obj_data["bbox_x"], 4),
-                    "y": round(obj_data["bbox_y"], 4),
-                    "z": round(obj_data["bbox_z"], 4),
-                },
-            }
+            self._object_stats_rows.append([
+                gltf_node.name,
+                obj_data["tri_count"],
+                obj_data["vertex_count"],
+                round(obj_data["bbox_x"], 4),
+                round(obj_data["bbox_y"], 4),
+                round(obj_data["bbox_z"], 4),
+            ])
 
 
 # ===================================================================
@@ -94,9 +116,6 @@ class glTF2ImportUserExtension:
     the Blender scene's METRO property groups.
     """
 
-    def __init__(self):
-        self.properties = bpy.context.scene.metro_core
-
     def gather_import_scene_after_hook(self, gltf_scene, blender_scene, gltf):
         """Called after a glTF scene has been imported."""
         if gltf_scene is None:
@@ -112,14 +131,16 @@ class glTF2ImportUserExtension:
         if isinstance(extras, dict):
             metro_data = extras.get("metro_metadata")
         elif isinstance(extras, str):
+            from .injector import _loads
             try:
-                parsed = json.loads(extras)
+                parsed = _loads(extras)
                 if isinstance(parsed, dict):
                     metro_data = parsed.get("metro_metadata")
-            except (json.JSONDecodeError, ValueError):
+            except ValueError:
                 pass
 
         if metro_data and isinstance(metro_data, dict):
+            from .reader import _apply_metro_dict
             _apply_metro_dict(blender_scene, metro_data)
 
             # Report to the user
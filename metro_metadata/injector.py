@@ -11,12 +11,62 @@ import os
 
 import bpy
 
+try:
+    # Optional C-accelerated JSON library; not bundled with Blender.
+    import orjson
+
+    def _dumps(obj, pretty=False):
+        opt = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            opt |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=opt).decode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj, pretty=False):
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False)
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+    _loads = json.loads
+
 from .constants import (
     FORMAT_TO_MIME,
     SCHEMA_VERSION,
     SCENE_METADATA_KEY,
     SIDECAR_EXTENSION,
 )
+from .utils import parse_comma_list
+
+
+# Last parsed processing_parameters: (raw string, parsed value)
+_proc_cache = (None, None)
+
+# Value types stored as-is by _to_idprop
+_IDPROP_SIMPLE_TYPES = frozenset((str, int, float, bool))
+_IDPROP_NUMBER_TYPES = frozenset((int, float, bool))
+
+# Buffer size for sidecar file writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# PropertyGroup fields read by collect_metadata, per group
+_CORE_FIELDS = (
+    "asset_name", "description", "asset_format", "tri_count", "tags", "use_case",
+)
+_PROVENANCE_FIELDS = ("provenance_tool", "provenance_source_data")
+_ACCESS_FIELDS = ("access_level", "license", "attribution_required")
+_LINEAGE_FIELDS = ("lineage_id", "derived_from_asset")
+_TECHNICAL_FIELDS = (
+    "lod_levels", "bounding_box_x", "bounding_box_y", "bounding_box_z",
+    "material_count", "has_textures", "supports_pbr", "vertex_count",
+    "scientific_domain", "source_data_format", "processing_parameters",
+)
+_PROJECT_FIELDS = (
+    "project_phase", "theme_scheme", "theme_code", "supports_vr",
+    "supports_ar", "usage_constraints", "usage_guidelines_viewer",
+    "usage_guidelines_notes", "deployment_notes", "geo_restrictions",
+    "access_scope",
+)
 
 
 def collect_metadata(scene):
@@ -30,239 +80,258 @@ def collect_metadata(scene):
     Returns:
         dict — API-compatible metadata.
     """
-    core = scene.metro_core
-    prov = scene.metro_provenance
-    access = scene.metro_access
-    lineage = scene.metro_lineage
-    tech = scene.metro_technical
-    proj = scene.metro_project
+    # Read every field once into plain dicts — each RNA attribute
+    # access is far slower than a dict lookup.
+    core = _read_fields(scene.metro_core, _CORE_FIELDS)
+    prov = _read_fields(scene.metro_provenance, _PROVENANCE_FIELDS)
+    access = _read_fields(scene.metro_access, _ACCESS_FIELDS)
+    lineage = _read_fields(scene.metro_lineage, _LINEAGE_FIELDS)
+    tech = _read_fields(scene.metro_technical, _TECHNICAL_FIELDS)
+    proj = _read_fields(scene.metro_project, _PROJECT_FIELDS)
 
     data = {
         "_schema_version": SCHEMA_VERSION,
     }
 
     # --- Core ---
-    if core.asset_name:
-        data["name"] = core.asset_name
-    if core.description:
-        data["description"] = core.description
-    data["format"] = core.asset_format
-    if core.tri_count > 0:
-        data["triCount"] = core.tri_count
-    if core.tags.strip():
-        data["tags"] = [t.strip() for t in core.tags.split(",") if t.strip()]
-    if core.use_case != "NONE":
-        data["useCase"] = core.use_case
+    if core["asset_name"]:
+        data["name"] = core["asset_name"]
+    if core["description"]:
+        data["description"] = core["description"]
+    asset_format = core["asset_format"]
+    data["format"] = asset_format
+    if core["tri_count"] > 0:
+        data["triCount"] = core["tri_count"]
+    if tags := _csv(core["tags"]):
+        data["tags"] = tags
+    if core["use_case"] != "NONE":
+        data["useCase"] = core["use_case"]
 
     # --- Provenance ---
     provenance = {}
-    if prov.provenance_tool:
-        provenance["tool"] = prov.provenance_tool
-    if prov.provenance_source_data.strip():
-        provenance["sourceData"] = [
-            s.strip() for s in prov.provenance_source_data.split(",") if s.strip()
-        ]
+    if prov["provenance_tool"]:
+        provenance["tool"] = prov["provenance_tool"]
+    if source_data := _csv(prov["provenance_source_data"]):
+        provenance["sourceData"] = source_data
     if provenance:
         data["provenance"] = provenance
 
     # --- Access control ---
-    data["accessLevel"] = access.access_level
-    if access.license != "NONE":
-        data["license"] = access.license
-    data["attributionRequired"] = access.attribution_required
+    data["accessLevel"] = access["access_level"]
+    if access["license"] != "NONE":
+        data["license"] = access["license"]
+    data["attributionRequired"] = access["attribution_required"]
 
     # --- Lineage ---
-    if lineage.lineage_id:
-        data["lineageId"] = lineage.lineage_id
-    if lineage.derived_from_asset.strip():
-        uris = [u.strip() for u in lineage.derived_from_asset.split(",") if u.strip()]
+    if lineage["lineage_id"]:
+        data["lineageId"] = lineage["lineage_id"]
+    if uris := _csv(lineage["derived_from_asset"]):
         data["derivedFromAsset"] = uris if len(uris) > 1 else uris[0]
 
     # --- Technical ---
-    if tech.lod_levels > 0:
-        data["lodLevels"] = tech.lod_levels
+    if tech["lod_levels"] > 0:
+        data["lodLevels"] = tech["lod_levels"]
 
-    if tech.bounding_box_x > 0 or tech.bounding_box_y > 0 or tech.bounding_box_z > 0:
+    bx, by, bz = tech["bounding_box_x"], tech["bounding_box_y"], tech["bounding_box_z"]
+    if bx > 0 or by > 0 or bz > 0:
         data["boundingBox"] = {
-            "x": round(tech.bounding_box_x, 4),
-            "y": round(tech.bounding_box_y, 4),
-            "z": round(tech.bounding_box_z, 4),
+            "x": round(bx, 4),
+            "y": round(by, 4),
+            "z": round(bz, 4),
         }
 
-    if tech.material_count > 0 or tech.has_textures or tech.supports_pbr:
+    material_count, has_textures, supports_pbr = (
+        tech["material_count"], tech["has_textures"], tech["supports_pbr"]
+    )
+    if material_count > 0 or has_textures or supports_pbr:
         data["materialProperties"] = {
-            "materialCount": tech.material_count,
-            "hasTextures": tech.has_textures,
-            "supportsPBR": tech.supports_pbr,
+            "materialCount": material_count,
+            "hasTextures": has_textures,
+            "supportsPBR": supports_pbr,
         }
 
-    if tech.vertex_count > 0:
+    if tech["vertex_count"] > 0:
         data["qualityMetrics"] = {
-            "vertexCount": tech.vertex_count,
+            "vertexCount": tech["vertex_count"],
         }
 
-    if tech.scientific_domain:
-        data["scientificDomain"] = tech.scientific_domain
-    if tech.source_data_format:
-        data["sourceDataFormat"] = tech.source_data_format
-    if tech.processing_parameters.strip():
-        try:
-            data["processingParameters"] = json.loads(tech.processing_parameters)
-        except (json.JSONDecodeError, ValueError):
-            data["processingParameters"] = tech.processing_parameters
+    if tech["scientific_domain"]:
+        data["scientificDomain"] = tech["scientific_domain"]
+    if tech["source_data_format"]:
+        data["sourceDataFormat"] = tech["source_data_format"]
+    if tech["processing_parameters"].strip():
+        data["processingParameters"] = _parse_processing_parameters(
+            tech["processing_parameters"]
+        )
 
     # --- Project ---
-    if proj.project_phase != "NONE":
-        data["projectPhase"] = proj.project_phase
-
-    if proj.theme_scheme or proj.theme_code:
-        theme = {}
-        if proj.theme_scheme:
-            theme["scheme"] = proj.theme_scheme
-        if proj.theme_code:
-            theme["code"] = proj.theme_code
+    if proj["project_phase"] != "NONE":
+        data["projectPhase"] = proj["project_phase"]
+
+    if theme := _compact(scheme=proj["theme_scheme"], code=proj["theme_code"]):
         data["theme"] = theme
 
-    if proj.supports_vr or proj.supports_ar:
+    supports_vr, supports_ar = proj["supports_vr"], proj["supports_ar"]
+    if supports_vr or supports_ar:
         data["visualizationCapabilities"] = {
-            "supportsVR": proj.supports_vr,
-            "supportsAR": proj.supports_ar,
+            "supportsVR": supports_vr,
+            "supportsAR": supports_ar,
         }
 
-    if proj.usage_constraints:
-        data["usageConstraints"] = proj.usage_constraints
+    if proj["usage_constraints"]:
+        data["usageConstraints"] = proj["usage_constraints"]
 
-    if proj.usage_guidelines_viewer or proj.usage_guidelines_notes:
-        guidelines = {}
-        if proj.usage_guidelines_viewer:
-            guidelines["recommended_viewer"] = proj.usage_guidelines_viewer
-        if proj.usage_guidelines_notes:
-            guidelines["notes"] = proj.usage_guidelines_notes
+    if guidelines := _compact(
+        recommended_viewer=proj["usage_guidelines_viewer"],
+        notes=proj["usage_guidelines_notes"],
+    ):
         data["usageGuidelines"] = guidelines
 
-    if proj.deployment_notes:
-        data["deploymentNotes"] = proj.deployment_notes
+    if proj["deployment_notes"]:
+        data["deploymentNotes"] = proj["deployment_notes"]
 
-    if proj.geo_restrictions.strip():
-        data["geoRestrictions"] = [
-            g.strip() for g in proj.geo_restrictions.split(",") if g.strip()
-        ]
+    if geo_restrictions := _csv(proj["geo_restrictions"]):
+        data["geoRestrictions"] = geo_restrictions
 
-    if proj.access_scope.strip():
-        data["accessScope"] = [
-            s.strip() for s in proj.access_scope.split(",") if s.strip()
-        ]
+    if access_scope := _csv(proj["access_scope"]):
+        data["accessScope"] = access_scope
 
     # --- Encoding format (derived) ---
-    fmt = core.asset_format
-    if fmt in FORMAT_TO_MIME:
-        data["encodingFormat"] = FORMAT_TO_MIME[fmt]
+    mime = FORMAT_TO_MIME.get(asset_format)
+    if mime is not None:
+        data["encodingFormat"] = mime
 
     return data
 
 
-def inject_into_scene(scene):
+def _parse_processing_parameters(raw):
+    """
+    Parse processing parameters as JSON, falling back to the raw string.
+
+    The last result is kept so edits to other fields don't re-parse an
+    unchanged (and possibly large) parameters blob.
+    """
+    global _proc_cache
+    cached_raw, parsed = _proc_cache
+    if cached_raw != raw:
+        try:
+            parsed = _loads(raw)
+        except ValueError:
+            parsed = raw
+        _proc_cache = (raw, parsed)
+    return parsed
+
+
+def _read_fields(group, fields):
+    """Read the given PropertyGroup fields into a plain dict in one sweep."""
+    return {name: getattr(group, name) for name in fields}
+
+
+def _compact(**fields):
+    """Build a nested block from the non-empty fields, or None if all are empty."""
+    return {key: value for key, value in fields.items() if value} or None
+
+
+def _csv(value):
+    """
+    Split a comma-separated string into stripped, non-empty items.
+
+    Returns None for empty or whitespace-only input so callers can
+    skip the field without an extra check.
+    """
+    # parse_comma_list returns a shared, cached tuple; copy it so the
+    # collected dict owns its lists
+    return list(parse_comma_list(value)) or None
+
+
+def inject_into_scene(scene, data=None):
     """
     Store the collected metadata as scene custom properties.
     This persists in .blend files and exports via glTF extras.
 
-    Stores in two ways:
-    1. Structured IDProperties under "metro_metadata" — these export
-       as proper JSON objects in glTF extras (Blender handles flat
-       dicts and simple nested values natively).
-    2. A JSON string backup under "metro_metadata_json" for robustness
-       with deeply nested or complex values.
+    Stores native IDProperties under "metro_metadata" — these export
+    as proper JSON objects in glTF extras (Blender handles dicts and
+    simple nested values natively). Any "metro_metadata_json" string
+    backup left by older versions is removed so it is not exported
+    as a duplicate copy.
 
     The glTF export hook (gltf_hooks.py) also writes the full structured
     metadata, so the file always carries the data regardless of method.
 
     Args:
         scene: bpy.types.Scene
+        data: Optional dict already returned by collect_metadata(scene).
 
     Returns:
         dict — the metadata that was injected.
     """
-    data = collect_metadata(scene)
+    if data is None:
+        data = collect_metadata(scene)
 
     # Store as structured IDProperties for glTF extras export.
     # Blender IDProperties support dicts with simple types natively.
-    _set_idprop_recursive(scene, SCENE_METADATA_KEY, data)
+    scene[SCENE_METADATA_KEY] = _to_idprop(data)
 
-    # Also keep a JSON string backup for lossless round-tripping
-    scene[SCENE_METADATA_KEY + "_json"] = json.dumps(
-        data, indent=2, ensure_ascii=False
-    )
+    # Drop the legacy JSON string backup; the native copy is sufficient
+    legacy_key = SCENE_METADATA_KEY + "_json"
+    if legacy_key in scene:
+        del scene[legacy_key]
 
     return data
 
 
-def _set_idprop_recursive(owner, key, value):
+def _to_idprop(value, depth=0):
     """
-    Set a custom property on a Blender data-block, handling nested
-    dicts and lists so they become proper IDPropertyGroup/IDPropertyArray.
+    Convert a metadata value to a form Blender can store as IDProperties,
+    in a single pass.
 
-    Blender 3.6+ supports nested IDProperties for dicts with simple values.
-    """
-    if isinstance(value, dict):
-        # For nested dicts, assign as a plain dict — Blender converts
-        # to IDPropertyGroup automatically in 3.6+.
-        # Filter out None values since IDProperties can't store None.
-        clean = {}
-        for k, v in value.items():
-            if v is None:
-                continue
-            if isinstance(v, dict):
-                # Flatten nested dicts to JSON strings if > 1 level deep
-                # to avoid IDProperty limitations
-                clean[k] = _simplify_for_idprop(v)
-            elif isinstance(v, list):
-                clean[k] = _simplify_for_idprop(v)
-            else:
-                clean[k] = v
-        owner[key] = clean
-    elif isinstance(value, list):
-        owner[key] = _simplify_for_idprop(value)
-    elif value is not None:
-        owner[key] = value
+    - None values in dicts are dropped (IDProperties can't store None).
+    - The top-level dict and its direct dict children become
+      IDPropertyGroups; anything nested deeper becomes a JSON string.
+    - Lists become homogeneous arrays (numbers kept, otherwise strings).
 
-
-def _simplify_for_idprop(value):
-    """
-    Simplify a value for IDProperty storage.
-    Dicts become plain dicts, complex nested structures become JSON strings.
+    Blender 3.6+ converts plain dicts to IDPropertyGroup automatically.
     """
-    if isinstance(value, dict):
-        # Check if all values are simple types
+    value_type = type(value)
+    if value_type is dict:
+        if depth == 0:
+            return {
+                k: _to_idprop(v, 1) for k, v in value.items() if v is not None
+            }
         simple = {}
         for k, v in value.items():
-            if v is None:
-                continue
-            if isinstance(v, (str, int, float, bool)):
+            v_type = type(v)
+            if v_type in _IDPROP_SIMPLE_TYPES:
                 simple[k] = v
-            elif isinstance(v, (dict, list)):
+            elif v is None:
+                continue
+            elif v_type is dict or v_type is list:
                 # Convert deeper nesting to JSON string
-                simple[k] = json.dumps(v, ensure_ascii=False)
+                simple[k] = _dumps(v)
             else:
                 simple[k] = str(v)
         return simple
-    elif isinstance(value, list):
-        # IDPropertyArray needs homogeneous types
-        if not value:
-            return []
-        if all(isinstance(v, (int, float)) for v in value):
+    if value_type is list:
+        # IDPropertyArray needs homogeneous types. Numeric lists (the
+        # common case) are returned as-is without allocating a copy.
+        for v in value:
+            if type(v) not in _IDPROP_NUMBER_TYPES:
+                break
+        else:
             return value
         # Convert to list of strings for mixed types
-        return [str(v) if not isinstance(v, str) else v for v in value]
+        return [v if type(v) is str else str(v) for v in value]
     return value
 
 
-def export_sidecar_json(scene, filepath=None):
+def export_sidecar_json(scene, filepath=None, data=None):
     """
     Export metadata as a .metro.json sidecar file.
 
     Args:
         scene: bpy.types.Scene
         filepath: Optional explicit path. If None, derives from .blend file path.
+        data: Optional dict already returned by collect_metadata(scene).
 
     Returns:
         str — path of the exported file.
@@ -270,7 +339,8 @@ def export_sidecar_json(scene, filepath=None):
     Raises:
         ValueError if no filepath can be determined.
     """
-    data = collect_metadata(scene)
+    if data is None:
+        data = collect_metadata(scene)
 
     if filepath is None:
         blend_path = bpy.data.filepath
@@ -281,7 +351,19 @@ def export_sidecar_json(scene, filepath=None):
         base = os.path.splitext(blend_path)[0]
         filepath = base + SIDECAR_EXTENSION
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Encode the whole document first and write it in one call —
+    # json.dump feeds f.write many tiny iterencode chunks. Writing to a
+    # temp file and renaming means a failed write never leaves a
+    # truncated sidecar behind.
+    payload = _dumps(data, pretty=True).encode("utf-8")
+    tmp_path = filepath + ".tmp"
+    try:
+        with open(tmp_path, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
     return filepath
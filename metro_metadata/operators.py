@@ -14,12 +14,28 @@ import bpy
 from bpy.types import Operator
 from bpy.props import BoolProperty, EnumProperty, StringProperty
 
+from .constants import SIDECAR_EXTENSION
 from .extractor import extract_from_scene
 from .reader import read_from_active_object
-from .injector import inject_into_scene, export_sidecar_json
+from .injector import collect_metadata, inject_into_scene, export_sidecar_json
+from .properties import (
+    METRO_PG_AccessControlMetadata,
+    METRO_PG_CoreMetadata,
+    METRO_PG_LineageMetadata,
+    METRO_PG_ProjectMetadata,
+    METRO_PG_ProvenanceMetadata,
+    METRO_PG_TechnicalMetadata,
+)
 from .utils import generate_uuid, validate_metadata
 
 
+# Scene attributes holding the METRO metadata property groups
+_METRO_GROUP_NAMES = (
+    "metro_core", "metro_provenance", "metro_access",
+    "metro_lineage", "metro_technical", "metro_project",
+)
+
+
 # ===================================================================
 # Extract from Scene
 # ===================================================================
@@ -65,15 +81,16 @@ class METRO_OT_InjectIntoScene(Operator):
         scene = context.scene
 
         # Validate first
-        errors = validate_metadata(scene)
+        data = collect_metadata(scene)
+        errors = validate_metadata(data)
         if errors:
             for field, msg in errors:
                 self.report({"WARNING"}, f"{field}: {msg}")
             self.report({"ERROR"}, "Fix validation errors before injecting")
             return {"CANCELLED"}
 
-        data = inject_into_scene(scene)
-        field_count = len([k for k in data.keys() if not k.startswith("_")])
+        data = inject_into_scene(scene, data=data)
+        field_count = len(data) - (1 if "_schema_version" in data else 0)
         self.report({"INFO"}, f"Injected {field_count} metadata fields into scene")
         return {"FINISHED"}
 
@@ -139,12 +156,11 @@ class METRO_OT_ExportSidecar(Operator):
 
     def invoke(self, context, event):
         # Pre-fill with .blend path if available
-        if bpy.data.filepath:
-            import os
-            base = os.path.splitext(bpy.data.filepath)[0]
-            self.filepath = base + ".metro.json"
+        blend_path = bpy.data.filepath
+        if blend_path:
+            self.filepath = os.path.splitext(blend_path)[0] + SIDECAR_EXTENSION
         else:
-            self.filepath = "untitled.metro.json"
+            self.filepath = "untitled" + SIDECAR_EXTENSION
 
         context.window_manager.fileselect_add(self)
         return {"RUNNING_MODAL"}
@@ -153,7 +169,8 @@ class METRO_OT_ExportSidecar(Operator):
         scene = context.scene
 
         # Validate first
-        errors = validate_metadata(scene)
+        data = collect_metadata(scene)
+        errors = validate_metadata(data)
         if errors:
             for field, msg in errors:
                 self.report({"WARNING"}, f"{field}: {msg}")
@@ -161,7 +178,7 @@ class METRO_OT_ExportSidecar(Operator):
             return {"CANCELLED"}
 
         try:
-            path = export_sidecar_json(scene, filepath=self.filepath)
+            path = export_sidecar_json(scene, filepath=self.filepath, data=data)
             self.report({"INFO"}, f"Exported sidecar to: {path}")
         except ValueError as e:
             self.report({"ERROR"}, str(e))
@@ -232,18 +249,20 @@ class METRO_OT_ExportGLTF(Operator):
         core = scene.metro_core
 
         # Pre-fill filename from asset name or blend file
-        if core.asset_name:
-            name = core.asset_name.replace(" ", "_")
-        elif bpy.data.filepath:
-            name = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+        asset_name = core.asset_name
+        blend_path = bpy.data.filepath
+        if asset_name:
+            name = asset_name.replace(" ", "_")
+        elif blend_path:
+            name = os.path.splitext(os.path.basename(blend_path))[0]
         else:
             name = "untitled"
 
         ext = ".glb" if self.export_format == "GLB" else ".gltf"
 
         # Default to the same directory as the blend file
-        if bpy.data.filepath:
-            directory = os.path.dirname(bpy.data.filepath)
+        if blend_path:
+            directory = os.path.dirname(blend_path)
             self.filepath = os.path.join(directory, name + ext)
         else:
             self.filepath = name + ext
@@ -255,7 +274,8 @@ class METRO_OT_ExportGLTF(Operator):
         scene = context.scene
 
         # Validate metadata
-        errors = validate_metadata(scene)
+        data = collect_metadata(scene)
+        errors = validate_metadata(data)
         if errors:
             for field, msg in errors:
                 self.report({"WARNING"}, f"{field}: {msg}")
@@ -263,8 +283,8 @@ class METRO_OT_ExportGLTF(Operator):
             return {"CANCELLED"}
 
         # Step 1: Inject metadata into scene custom properties
-        data = inject_into_scene(scene)
-        field_count = len([k for k in data.keys() if not k.startswith("_")])
+        data = inject_into_scene(scene, data=data)
+        field_count = len(data) - (1 if "_schema_version" in data else 0)
 
         # Ensure file extension matches format
         filepath = self.filepath
@@ -297,6 +317,20 @@ class METRO_OT_ExportGLTF(Operator):
 # Clear All Metadata
 # ===================================================================
 
+# Property names per scene group, resolved once at import
+_CLEAR_FIELDS = {
+    group_name: tuple(cls.__annotations__)
+    for group_name, cls in zip(_METRO_GROUP_NAMES, (
+        METRO_PG_CoreMetadata,
+        METRO_PG_ProvenanceMetadata,
+        METRO_PG_AccessControlMetadata,
+        METRO_PG_LineageMetadata,
+        METRO_PG_TechnicalMetadata,
+        METRO_PG_ProjectMetadata,
+    ))
+}
+
+
 class METRO_OT_ClearMetadata(Operator):
     """Clear all METRO metadata fields"""
 
@@ -311,15 +345,20 @@ class METRO_OT_ClearMetadata(Operator):
     def execute(self, context):
         scene = context.scene
 
-        # Reset each property group by iterating over its properties
-        for group_name in (
-            "metro_core", "metro_provenance", "metro_access",
-            "metro_lineage", "metro_technical", "metro_project",
-        ):
+        for group_name in _METRO_GROUP_NAMES:
+            # Unsetting the pointer property drops the whole group's
+            # stored values in one call, resetting every field.
+            try:
+                scene.property_unset(group_name)
+                continue
+            except (TypeError, AttributeError):
+                pass
+
+            # Fall back to resetting each property individually
             group = getattr(scene, group_name, None)
             if group is None:
                 continue
-            for prop_name in group.__annotations__:
+            for prop_name in _CLEAR_FIELDS[group_name]:
                 try:
                     group.property_unset(prop_name)
                 except (TypeError, AttributeError):
@@ -344,11 +383,5 @@ OPERATOR_CLASSES = [
 ]
 
 
-def register_operators():
-    for cls in OPERATOR_CLASSES:
-        bpy.utils.register_class(cls)
-
-
-def unregister_operators():
-    for cls in reversed(OPERATOR_CLASSES):
-        bpy.utils.unregister_class(cls)
+# Registers in list order, unregisters in reverse
+register_operators, unregister_operators = bpy.utils.register_classes_factory(OPERATOR_CLASSES)
@@ -333,11 +333,5 @@ PANEL_CLASSES = [
 ]
 
 
-def register_panels():
-    for cls in PANEL_CLASSES:
-        bpy.utils.register_class(cls)
-
-
-def unregister_panels():
-    for cls in reversed(PANEL_CLASSES):
-        bpy.utils.unregister_class(cls)
+# Registers in list order, unregisters in reverse
+register_panels, unregister_panels = bpy.utils.register_classes_factory(PANEL_CLASSES)
@@ -21,6 +21,7 @@ from .constants import (
     PROJECT_PHASE_ITEMS,
     USE_CASE_ITEMS,
 )
+from .utils import parse_comma_list
 
 
 # ===================================================================
@@ -320,30 +321,37 @@ PROPERTY_CLASSES = [
     METRO_PG_UIState,
 ]
 
+# Scene attribute -> property group, in registration order
+SCENE_POINTERS = (
+    ("metro_core", METRO_PG_CoreMetadata),
+    ("metro_provenance", METRO_PG_ProvenanceMetadata),
+    ("metro_access", METRO_PG_AccessControlMetadata),
+    ("metro_lineage", METRO_PG_LineageMetadata),
+    ("metro_technical", METRO_PG_TechnicalMetadata),
+    ("metro_project", METRO_PG_ProjectMetadata),
+    ("metro_ui", METRO_PG_UIState),
+)
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(
+    PROPERTY_CLASSES
+)
+
 
 def register_properties():
     """Register all property groups and attach them to Scene."""
-    for cls in PROPERTY_CLASSES:
-        bpy.utils.register_class(cls)
+    # Every group is registered eagerly: RNA cannot be registered from a
+    # draw callback, and saved scenes need their groups to load values.
+    _register_classes()
 
-    bpy.types.Scene.metro_core = PointerProperty(type=METRO_PG_CoreMetadata)
-    bpy.types.Scene.metro_provenance = PointerProperty(type=METRO_PG_ProvenanceMetadata)
-    bpy.types.Scene.metro_access = PointerProperty(type=METRO_PG_AccessControlMetadata)
-    bpy.types.Scene.metro_lineage = PointerProperty(type=METRO_PG_LineageMetadata)
-    bpy.types.Scene.metro_technical = PointerProperty(type=METRO_PG_TechnicalMetadata)
-    bpy.types.Scene.metro_project = PointerProperty(type=METRO_PG_ProjectMetadata)
-    bpy.types.Scene.metro_ui = PointerProperty(type=METRO_PG_UIState)
+    for attr, cls in SCENE_POINTERS:
+        setattr(bpy.types.Scene, attr, PointerProperty(type=cls))
 
 
 def unregister_properties():
     """Unregister all property groups and remove from Scene."""
-    del bpy.types.Scene.metro_ui
-    del bpy.types.Scene.metro_project
-    del bpy.types.Scene.metro_technical
-    del bpy.types.Scene.metro_lineage
-    del bpy.types.Scene.metro_access
-    del bpy.types.Scene.metro_provenance
-    del bpy.types.Scene.metro_core
-
-    for cls in reversed(PROPERTY_CLASSES):
-        bpy.utils.unregister_class(cls)
+    for attr, _cls in reversed(SCENE_POINTERS):
+        delattr(bpy.types.Scene, attr)
+
+    _unregister_classes()
+
+    parse_comma_list.cache_clear()
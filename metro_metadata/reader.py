@@ -7,10 +7,30 @@ Supports:
 - Generic object custom properties
 """
 
-import json
 import bpy
 
-from .constants import GLTF_EXTRAS_ALIASES, SCENE_METADATA_KEY
+from .constants import (
+    ACCESS_LEVEL_ITEMS,
+    ASSET_FORMAT_ITEMS,
+    GLTF_EXTRAS_ALIASES,
+    LICENSE_ITEMS,
+    PROJECT_PHASE_ITEMS,
+    SCENE_METADATA_KEY,
+    USE_CASE_ITEMS,
+)
+from .injector import _loads
+
+
+# Alias lookup keyed by lowercased extras key, built once at import
+_ALIASES_LOWER = {k.lower(): v for k, v in GLTF_EXTRAS_ALIASES.items()}
+
+# Custom property keys that are never treated as foreign metadata
+_OBJECT_SKIP_KEYS = frozenset(("cycles", "cycles_visibility"))
+_SCENE_SKIP_KEYS = frozenset((
+    SCENE_METADATA_KEY, "metro_core", "metro_provenance",
+    "metro_access", "metro_lineage", "metro_technical",
+    "metro_project", "metro_ui",
+))
 
 
 def read_from_active_object(scene):
@@ -26,29 +46,57 @@ def read_from_active_object(scene):
             "mapped"  — list of field names that were auto-populated
             "raw"     — dict of unrecognized custom properties
     """
-    mapped_fields = []
+    # dict keys: ordered de-duplication of mapped field names
+    mapped_fields = {}
     raw_props = {}
 
     # 1. Check if scene already has metro_metadata stored
     scene_meta = _read_scene_metro_metadata(scene)
     if scene_meta:
-        mapped_fields.extend(_apply_metro_dict(scene, scene_meta))
+        mapped_fields.update(dict.fromkeys(_apply_metro_dict(scene, scene_meta)))
 
     # 2. Read from active object custom properties (glTF extras land here)
     obj = bpy.context.active_object
     if obj:
-        obj_meta, obj_raw = _read_object_custom_props(obj)
-        if obj_meta:
-            newly_mapped = _apply_metro_dict(scene, obj_meta)
-            mapped_fields.extend(newly_mapped)
-        raw_props.update(obj_raw)
+        obj_result = read_many(scene, (obj,))
+        mapped_fields.update(dict.fromkeys(obj_result["mapped"]))
+        raw_props.update(obj_result["raw"])
 
     # 3. Read from scene-level custom properties (non-metro keys)
     scene_raw = _read_scene_custom_props(scene)
     raw_props.update(scene_raw)
 
     return {
-        "mapped": list(set(mapped_fields)),
+        "mapped": list(mapped_fields),
+        "raw": raw_props,
+    }
+
+
+def read_many(scene, objects):
+    """
+    Read metadata from several objects' custom properties and populate
+    METRO property groups once.
+
+    Values are staged in a plain dict first (later objects win), so the
+    RNA property writes happen once per field rather than once per object.
+
+    Args:
+        scene: bpy.types.Scene
+        objects: iterable of bpy.types.Object
+
+    Returns:
+        dict with "mapped" and "raw" keys, as read_from_active_object.
+    """
+    staged = {}
+    raw_props = {}
+
+    for obj in objects:
+        obj_meta, obj_raw = _read_object_custom_props(obj)
+        staged.update(obj_meta)
+        raw_props.update(obj_raw)
+
+    return {
+        "mapped": _apply_metro_dict(scene, staged) if staged else [],
         "raw": raw_props,
     }
 
@@ -70,18 +118,18 @@ def _read_scene_metro_metadata(scene):
         # Might be a JSON string
         if isinstance(raw, str):
             try:
-                return json.loads(raw)
-            except (json.JSONDecodeError, ValueError):
+                return _loads(raw)
+            except ValueError:
                 pass
 
-    # Fall back to JSON backup key
+    # Fall back to the JSON backup key written by older versions
     json_key = SCENE_METADATA_KEY + "_json"
     if json_key in scene:
         raw = scene[json_key]
         if isinstance(raw, str):
             try:
-                return json.loads(raw)
-            except (json.JSONDecodeError, ValueError):
+                return _loads(raw)
+            except ValueError:
                 pass
 
     return None
@@ -94,11 +142,25 @@ def _read_object_custom_props(obj):
     Returns:
         (metro_compatible_dict, raw_unrecognized_dict)
     """
+    # Most objects carry no custom properties at all
+    keys = list(obj.keys())
+    if not keys:
+        return {}, {}
+
+    # Only a METRO block: merge it without the per-key alias checks
+    if keys == [SCENE_METADATA_KEY]:
+        value = _idprop_to_python(obj[SCENE_METADATA_KEY])
+        if isinstance(value, dict):
+            return value, {}
+        return {}, {SCENE_METADATA_KEY: value}
+
     metro = {}
     raw = {}
+    skip = _OBJECT_SKIP_KEYS.__contains__
+    alias_get = _ALIASES_LOWER.get
 
-    for key in obj.keys():
-        if key.startswith("_") or key in ("cycles", "cycles_visibility"):
+    for key in keys:
+        if key[:1] == "_" or skip(key):
             continue
 
         value = obj[key]
@@ -112,7 +174,7 @@ def _read_object_custom_props(obj):
             continue
 
         # Try to map via known aliases
-        metro_field = GLTF_EXTRAS_ALIASES.get(key.lower())
+        metro_field = alias_get(key.lower())
         if metro_field:
             metro[metro_field] = value
         else:
@@ -124,26 +186,16 @@ def _read_object_custom_props(obj):
 def _read_scene_custom_props(scene):
     """Read non-METRO custom properties from the scene."""
     raw = {}
-    skip_keys = {
-        SCENE_METADATA_KEY, "metro_core", "metro_provenance",
-        "metro_access", "metro_lineage", "metro_technical",
-        "metro_project", "metro_ui",
-    }
+    skip = _SCENE_SKIP_KEYS.__contains__
+    is_alias = _ALIASES_LOWER.__contains__
 
     for key in scene.keys():
-        if key.startswith("_") or key in skip_keys:
-            continue
-
-        value = scene[key]
-        value = _idprop_to_python(value)
-
-        # Try alias mapping
-        metro_field = GLTF_EXTRAS_ALIASES.get(key.lower())
-        if metro_field:
-            # Will be handled in apply step; skip raw
+        # Alias-mapped keys are handled in the apply step; skip raw.
+        # Checked before conversion so mapped values are never copied.
+        if key[:1] == "_" or skip(key) or is_alias(key.lower()):
             continue
 
-        raw[key] = value
+        raw[key] = _idprop_to_python(scene[key])
 
     return raw
 
@@ -152,6 +204,72 @@ def _read_scene_custom_props(scene):
 # Internal: apply to property groups
 # -------------------------------------------------------------------
 
+# Simple field mappings: (scene group attr, property, kind, source keys).
+# The first source key holding a usable value wins.
+_APPLY_SPEC = (
+    # Core
+    ("metro_core", "asset_name", "str", ("name", "asset_name", "title")),
+    ("metro_core", "description", "str", ("description",)),
+    ("metro_core", "asset_format", "enum", ("format", "asset_format")),
+    ("metro_core", "tri_count", "int", ("triCount", "tri_count", "triangleCount")),
+    ("metro_core", "tags", "list", ("tags", "keywords", "dcat:keyword")),
+    ("metro_core", "use_case", "enum", ("useCase", "use_case")),
+    # Provenance
+    ("metro_provenance", "provenance_tool", "str", ("provenance_tool", "generatedWith")),
+    # Access
+    ("metro_access", "access_level", "enum", ("accessLevel", "access_level")),
+    ("metro_access", "license", "enum", ("license",)),
+    # Lineage
+    ("metro_lineage", "lineage_id", "str", ("lineageId", "lineage_id")),
+    # Technical
+    ("metro_technical", "vertex_count", "int", ("vertexCount", "vertex_count")),
+    ("metro_technical", "lod_levels", "int", ("lodLevels", "lod_levels")),
+    ("metro_technical", "scientific_domain", "str", ("scientificDomain", "scientific_domain")),
+    ("metro_technical", "source_data_format", "str", ("sourceDataFormat", "source_data_format")),
+    # Project
+    ("metro_project", "project_phase", "enum", ("projectPhase", "project_phase")),
+    ("metro_project", "usage_constraints", "str", ("usageConstraints", "usage_constraints")),
+    ("metro_project", "deployment_notes", "str", ("deploymentNotes", "deployment_notes")),
+)
+
+_APPLY_GROUPS = tuple(dict.fromkeys(attr for attr, _, _, _ in _APPLY_SPEC))
+
+# Reverse map: source key -> (_APPLY_SPEC row, key priority within the row)
+_ALIAS_TO_FIELD = {
+    key: (row, rank)
+    for row, (_, _, _, keys) in enumerate(_APPLY_SPEC)
+    for rank, key in enumerate(keys)
+}
+
+
+def _join_list(value):
+    """Join a list value into a comma-separated string."""
+    if isinstance(value, list):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+# kind -> value converter. Only "int" accepts falsy values (e.g. 0).
+_CONVERTERS = {"str": str, "enum": str, "int": int, "list": _join_list}
+
+# Valid identifiers per enum property, checked before assignment so
+# unknown values are skipped without an RNA TypeError round-trip
+_ENUM_VALIDS = {
+    "asset_format": frozenset(item[0] for item in ASSET_FORMAT_ITEMS),
+    "use_case": frozenset(item[0] for item in USE_CASE_ITEMS),
+    "access_level": frozenset(item[0] for item in ACCESS_LEVEL_ITEMS),
+    "license": frozenset(item[0] for item in LICENSE_ITEMS),
+    "project_phase": frozenset(item[0] for item in PROJECT_PHASE_ITEMS),
+}
+
+# _APPLY_SPEC resolved per row at import:
+# (group attr, property, converter, valid enum ids or None, accepts falsy)
+_APPLY_ROWS = tuple(
+    (attr, prop_name, _CONVERTERS[kind], _ENUM_VALIDS.get(prop_name), kind == "int")
+    for attr, prop_name, kind, _keys in _APPLY_SPEC
+)
+
+
 def _apply_metro_dict(scene, data):
     """
     Apply a dict of metadata values to the scene's METRO property groups.
@@ -164,88 +282,98 @@ def _apply_metro_dict(scene, data):
         list of field names that were successfully mapped.
     """
     mapped = []
+    # Bound locals for the per-field loop
+    get = data.get
+    append = mapped.append
+    set_prop = setattr
+    rows = _APPLY_ROWS
+    groups = {attr: getattr(scene, attr) for attr in _APPLY_GROUPS}
+
+    # One pass over the data collects candidate values per table row
+    alias_get = _ALIAS_TO_FIELD.get
+    candidates = {}
+    for key, val in data.items():
+        hit = alias_get(key)
+        if hit is not None:
+            candidates.setdefault(hit[0], []).append((hit[1], val))
+
+    for row in sorted(candidates):
+        attr, prop_name, convert, valid, accepts_falsy = rows[row]
+        group = groups[attr]
+        # Ranks are unique within a row, so values are never compared
+        for _rank, val in sorted(candidates[row]):
+            if val is None or (not val and not accepts_falsy):
+                continue
+            if valid is not None:
+                val = str(val)
+                if val not in valid:
+                    continue
+            try:
+                set_prop(group, prop_name, convert(val))
+            except (TypeError, ValueError, AttributeError):
+                # Wrong value type for the property — try the next key
+                continue
+            append(prop_name)
+            break
 
-    core = scene.metro_core
-    prov = scene.metro_provenance
-    access = scene.metro_access
-    lineage = scene.metro_lineage
-    tech = scene.metro_technical
-    proj = scene.metro_project
-
-    # Core
-    mapped += _set_if("asset_name", data, core, ["name", "asset_name", "title"])
-    mapped += _set_if("description", data, core, ["description"])
-    mapped += _set_if("asset_format", data, core, ["format", "asset_format"])
-    mapped += _set_if("tri_count", data, core, ["triCount", "tri_count", "triangleCount"])
-    mapped += _set_tags(data, core)
-    mapped += _set_enum("use_case", data, core, ["useCase", "use_case"])
+    prov = groups["metro_provenance"]
+    access = groups["metro_access"]
+    lineage = groups["metro_lineage"]
+    tech = groups["metro_technical"]
+    proj = groups["metro_project"]
 
     # Provenance
-    mapped += _set_if("provenance_tool", data, prov, ["provenance_tool", "generatedWith"])
-    if "provenance" in data and isinstance(data["provenance"], dict):
-        p = data["provenance"]
+    p = get("provenance")
+    if isinstance(p, dict):
         if "tool" in p:
             prov.provenance_tool = str(p["tool"])
-            mapped.append("provenance_tool")
+            append("provenance_tool")
         if "sourceData" in p:
-            src = p["sourceData"]
-            if isinstance(src, list):
-                prov.provenance_source_data = ", ".join(str(s) for s in src)
-            else:
-                prov.provenance_source_data = str(src)
-            mapped.append("provenance_source_data")
+            prov.provenance_source_data = _join_list(p["sourceData"])
+            append("provenance_source_data")
 
     # Access
-    mapped += _set_enum("access_level", data, access, ["accessLevel", "access_level"])
-    mapped += _set_if("license", data, access, ["license"])
     if "attributionRequired" in data or "attribution_required" in data:
-        val = data.get("attributionRequired", data.get("attribution_required"))
+        val = get("attributionRequired", get("attribution_required"))
         access.attribution_required = bool(val)
-        mapped.append("attribution_required")
+        append("attribution_required")
 
     # Lineage
-    mapped += _set_if("lineage_id", data, lineage, ["lineageId", "lineage_id"])
     if "derivedFromAsset" in data or "derived_from_asset" in data:
-        val = data.get("derivedFromAsset", data.get("derived_from_asset"))
-        if isinstance(val, list):
-            lineage.derived_from_asset = ", ".join(str(v) for v in val)
-        else:
-            lineage.derived_from_asset = str(val) if val else ""
-        mapped.append("derived_from_asset")
-
-    # Technical
-    mapped += _set_int("vertex_count", data, tech, ["vertexCount", "vertex_count"])
-    mapped += _set_int("lod_levels", data, tech, ["lodLevels", "lod_levels"])
-    mapped += _set_if("scientific_domain", data, tech, ["scientificDomain", "scientific_domain"])
-    mapped += _set_if("source_data_format", data, tech, ["sourceDataFormat", "source_data_format"])
+        val = get("derivedFromAsset", get("derived_from_asset"))
+        lineage.derived_from_asset = _join_list(val) if val else ""
+        append("derived_from_asset")
 
     # Bounding box
-    if "boundingBox" in data and isinstance(data["boundingBox"], dict):
-        bb = data["boundingBox"]
-        tech.bounding_box_x = float(bb.get("x", 0))
-        tech.bounding_box_y = float(bb.get("y", 0))
-        tech.bounding_box_z = float(bb.get("z", 0))
-        mapped.append("bounding_box")
+    bb = get("boundingBox")
+    if isinstance(bb, dict):
+        bb_get = bb.get
+        x, y, z = bb_get("x", 0.0), bb_get("y", 0.0), bb_get("z", 0.0)
+        tech.bounding_box_x = float(x)
+        tech.bounding_box_y = float(y)
+        tech.bounding_box_z = float(z)
+        append("bounding_box")
 
     # Material properties
-    if "materialProperties" in data and isinstance(data["materialProperties"], dict):
-        mp = data["materialProperties"]
-        tech.material_count = int(mp.get("materialCount", 0))
-        tech.has_textures = bool(mp.get("hasTextures", False))
-        tech.supports_pbr = bool(mp.get("supportsPBR", False))
-        mapped.append("material_properties")
-
-    # Project
-    mapped += _set_enum("project_phase", data, proj, ["projectPhase", "project_phase"])
-    mapped += _set_if("usage_constraints", data, proj, ["usageConstraints", "usage_constraints"])
-    mapped += _set_if("deployment_notes", data, proj, ["deploymentNotes", "deployment_notes"])
+    mp = get("materialProperties")
+    if isinstance(mp, dict):
+        mp_get = mp.get
+        mc, ht, pbr = (
+            mp_get("materialCount", 0),
+            mp_get("hasTextures", False),
+            mp_get("supportsPBR", False),
+        )
+        tech.material_count = int(mc)
+        tech.has_textures = bool(ht)
+        tech.supports_pbr = bool(pbr)
+        append("material_properties")
 
     # Visualization capabilities
-    if "visualizationCapabilities" in data and isinstance(data["visualizationCapabilities"], dict):
-        vc = data["visualizationCapabilities"]
+    vc = get("visualizationCapabilities")
+    if isinstance(vc, dict):
         proj.supports_vr = bool(vc.get("supportsVR", False))
         proj.supports_ar = bool(vc.get("supportsAR", False))
-        mapped.append("visualization_capabilities")
+        append("visualization_capabilities")
 
     return mapped
 
@@ -254,61 +382,18 @@ def _apply_metro_dict(scene, data):
 # Helpers
 # -------------------------------------------------------------------
 
+# Custom property values that are already plain Python
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
 def _idprop_to_python(value):
     """Convert Blender IDProperty types to plain Python types."""
-    if hasattr(value, "to_dict"):
-        return value.to_dict()
-    if hasattr(value, "to_list"):
-        return value.to_list()
+    if type(value) in _PRIMITIVE_TYPES:
+        return value
+    to_dict = getattr(value, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    to_list = getattr(value, "to_list", None)
+    if to_list is not None:
+        return to_list()
     return value
-
-
-def _set_if(prop_name, data, group, keys):
-    """Set a string property if any of the keys exist in data."""
-    for key in keys:
-        if key in data and data[key]:
-            try:
-                setattr(group, prop_name, str(data[key]))
-                return [prop_name]
-            except (TypeError, AttributeError):
-                pass
-    return []
-
-
-def _set_int(prop_name, data, group, keys):
-    """Set an integer property if any of the keys exist in data."""
-    for key in keys:
-        if key in data and data[key] is not None:
-            try:
-                setattr(group, prop_name, int(data[key]))
-                return [prop_name]
-            except (TypeError, ValueError, AttributeError):
-                pass
-    return []
-
-
-def _set_enum(prop_name, data, group, keys):
-    """Set an enum property if any of the keys exist and match a valid value."""
-    for key in keys:
-        if key in data and data[key]:
-            val = str(data[key])
-            try:
-                setattr(group, prop_name, val)
-                return [prop_name]
-            except TypeError:
-                # Value not in enum items — skip
-                pass
-    return []
-
-
-def _set_tags(data, core):
-    """Set tags from various formats (list, comma-separated string)."""
-    for key in ("tags", "keywords", "dcat:keyword"):
-        if key in data and data[key]:
-            val = data[key]
-            if isinstance(val, list):
-                core.tags = ", ".join(str(t) for t in val)
-            else:
-                core.tags = str(val)
-            return ["tags"]
-    return []
@@ -5,13 +5,15 @@ UUID generation, validation, and formatting helpers.
 
 import re
 import uuid
+from functools import lru_cache
 
 
-# UUID v4 pattern
-_UUID_PATTERN = re.compile(
-    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$",
-    re.IGNORECASE,
-)
+# UUID v4 character classes (case-insensitive)
+_HEX = frozenset("0123456789abcdefABCDEF")
+_VARIANT = frozenset("89abAB")
+
+# One comma-separated item, without surrounding whitespace
+_CSV_ITEM = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
 
 
 def generate_uuid():
@@ -21,24 +23,37 @@ def generate_uuid():
 
 def is_valid_uuid(value):
     """Check if a string is a valid UUID v4."""
-    if not value or not isinstance(value, str):
-        return False
-    return bool(_UUID_PATTERN.match(value))
-
-
+    # xxxxxxxx-xxxx-4xxx-[89ab]xxx-xxxxxxxxxxxx: fixed layout, so check
+    # the separators and version/variant digits by position
+    return (
+        value.__class__ is str
+        and len(value) == 36
+        and value[8] == "-" and value[13] == "-"
+        and value[18] == "-" and value[23] == "-"
+        and value[14] == "4"
+        and value[19] in _VARIANT
+        and value.count("-") == 4
+        and _HEX.issuperset(value.replace("-", ""))
+    )
+
+
+@lru_cache(maxsize=256)
 def parse_comma_list(value):
     """
-    Parse a comma-separated string into a list of stripped, non-empty strings.
+    Parse a comma-separated string into a tuple of stripped, non-empty strings.
+
+    Memoized: the same tags/URI strings are re-parsed on every validation
+    and collection, so the result is a tuple that is safe to share.
 
     Args:
         value: str — e.g. "tag1, tag2, tag3"
 
     Returns:
-        list[str] — e.g. ["tag1", "tag2", "tag3"]
+        tuple[str] — e.g. ("tag1", "tag2", "tag3")
     """
     if not value or not isinstance(value, str):
-        return []
-    return [item.strip() for item in value.split(",") if item.strip()]
+        return ()
+    return tuple(_CSV_ITEM.findall(value))
 
 
 def to_comma_string(items):
@@ -54,7 +69,7 @@ def to_comma_string(items):
     if isinstance(items, str):
         return items
     if isinstance(items, (list, tuple)):
-        return ", ".join(str(item) for item in items if item)
+        return ", ".join(map(str, filter(None, items)))
     return str(items) if items else ""
 
 
@@ -65,79 +80,56 @@ def truncate(text, max_length):
     return text[: max_length - 3] + "..."
 
 
-def validate_name(name):
+def validate_metadata(data):
     """
-    Validate an asset name per API rules (1-100 chars).
-
-    Returns:
-        (bool, str) — (is_valid, error_message)
-    """
-    if not name:
-        return False, "Name is required"
-    if len(name) > 100:
-        return False, f"Name too long ({len(name)}/100 characters)"
-    return True, ""
-
-
-def validate_description(description):
-    """
-    Validate a description per API rules (0-500 chars).
-
-    Returns:
-        (bool, str) — (is_valid, error_message)
-    """
-    if description and len(description) > 500:
-        return False, f"Description too long ({len(description)}/500 characters)"
-    return True, ""
-
-
-def validate_tags(tags_string):
-    """
-    Validate tags: up to 20 tags, each 1-50 characters.
-
-    Args:
-        tags_string: comma-separated string
-
-    Returns:
-        (bool, str) — (is_valid, error_message)
-    """
-    tags = parse_comma_list(tags_string)
-    if len(tags) > 20:
-        return False, f"Too many tags ({len(tags)}/20)"
-    for tag in tags:
-        if len(tag) > 50:
-            return False, f"Tag '{truncate(tag, 20)}' too long ({len(tag)}/50 chars)"
-    return True, ""
-
-
-def validate_metadata(scene):
-    """
-    Validate all metadata fields on the scene.
+    Validate all metadata fields.
 
     Args:
-        scene: bpy.types.Scene
+        data: dict returned by collect_metadata(), or a bpy.types.Scene
+            (collected first). Passing the dict lets callers that go on
+            to inject/export reuse it instead of reading the scene twice.
 
     Returns:
         list of (field_name, error_message) tuples. Empty if all valid.
     """
-    errors = []
-
-    core = scene.metro_core
+    if not isinstance(data, dict):
+        from .injector import collect_metadata
+        data = collect_metadata(data)
 
-    valid, msg = validate_name(core.asset_name)
-    if not valid:
-        errors.append(("name", msg))
-
-    valid, msg = validate_description(core.description)
-    if not valid:
-        errors.append(("description", msg))
+    errors = []
 
-    valid, msg = validate_tags(core.tags)
-    if not valid:
-        errors.append(("tags", msg))
+    # API rules: name 1-100 chars, description up to 500 chars, up to
+    # 20 tags of 1-50 chars each. Messages are only built on failure.
+    name = data.get("name")
+    if not name:
+        errors.append(("name", "Name is required"))
+    elif len(name) > 100:
+        errors.append(("name", f"Name too long ({len(name)}/100 characters)"))
 
-    lineage = scene.metro_lineage
-    if lineage.lineage_id and not is_valid_uuid(lineage.lineage_id):
+    description = data.get("description")
+    if description and len(description) > 500:
+        errors.append((
+            "description",
+            f"Description too long ({len(description)}/500 characters)",
+        ))
+
+    tags = data.get("tags")
+    if tags:
+        if not isinstance(tags, (list, tuple)):
+            tags = parse_comma_list(tags)
+        if len(tags) > 20:
+            errors.append(("tags", f"Too many tags ({len(tags)}/20)"))
+        else:
+            for tag in tags:
+                if len(tag) > 50:
+                    errors.append((
+                        "tags",
+                        f"Tag '{truncate(tag, 20)}' too long ({len(tag)}/50 chars)",
+                    ))
+                    break
+
+    lineage_id = data.get("lineageId", "")
+    if lineage_id and not is_valid_uuid(lineage_id):
         errors.append(("lineageId", "Lineage ID must be a valid UUID v4"))
 
     return errors